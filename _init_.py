@@ -1,4 +1,5 @@
-__all__ = ['ThreadManager', 'SafeFileWriter']
+__all__ = ['ThreadManager', 'AsyncThreadManager', 'SafeFileWriter', 'QueuedFileWriter', 'ShardedFileWriter']
 
 from .thread_manager import ThreadManager
-from .safe_file_writer import SafeFileWriter
\ No newline at end of file
+from .async_thread_manager import AsyncThreadManager
+from .safe_file_writer import SafeFileWriter, QueuedFileWriter, ShardedFileWriter
\ No newline at end of file
@@ -0,0 +1,240 @@
+import asyncio
+import functools
+import inspect
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from time import monotonic as _now
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from .thread_manager import _claim_name
+
+
+@dataclass
+class ManagedTask:
+    """
+    Metadata and state for a job run by AsyncThreadManager.
+    start_time/end_time come from time.monotonic(); use them for durations.
+    """
+    name: str
+    is_coro: bool
+    started: bool = False
+    start_time: Optional[float] = None
+    end_time: Optional[float] = None
+    result: Any = None
+    exception: Optional[Exception] = None
+    handle: Optional["asyncio.Task"] = field(default=None, repr=False)
+    call: Optional[Callable[[], Awaitable[Any]]] = field(default=None, repr=False)
+
+    @property
+    def alive(self) -> bool:
+        return self.handle is not None and not self.handle.done()
+
+    @property
+    def duration(self) -> Optional[float]:
+        if self.start_time is None:
+            return None
+        end = self.end_time if self.end_time is not None else _now()
+        return end - self.start_time
+
+
+class AsyncThreadManager:
+    """
+    asyncio counterpart of ThreadManager.
+
+    Coroutine functions run as asyncio tasks on the event loop, so they need
+    no OS thread of their own. Blocking callables are still supported and run
+    in the loop's default executor. Exceptions are captured per job like
+    ThreadManager(safe=True).
+
+    Use `await start_all()` / `await join_all()` from async code, or the
+    blocking `run()` when no event loop is running.
+    """
+
+    def __init__(self) -> None:
+        self._log = logging.getLogger(self.__class__.__name__)
+        self._items: Dict[str, ManagedTask] = {}
+        self._name_counts: Dict[str, int] = {}  # base name -> last suffix handed out
+        self.cancel_event = threading.Event()
+        self._executor: Optional[ThreadPoolExecutor] = None  # None: the loop's default
+
+    # ---------- Public API ----------
+
+    def add_coro(
+        self,
+        coro_fn: Callable[..., Awaitable[Any]],
+        args: Tuple[Any, ...] = (),
+        kwargs: Optional[Dict[str, Any]] = None,
+        *,
+        name: Optional[str] = None,
+    ) -> ManagedTask:
+        """Register a coroutine function to run as an asyncio task."""
+        if not inspect.iscoroutinefunction(coro_fn):
+            raise TypeError("coro_fn must be a coroutine function")
+        call = functools.partial(coro_fn, *args, **(kwargs or {}))
+        return self._register(name or getattr(coro_fn, "__name__", "task"), True, call)
+
+    def add_thread(
+        self,
+        target: Callable[..., Any],
+        args: Tuple[Any, ...] = (),
+        kwargs: Optional[Dict[str, Any]] = None,
+        *,
+        name: Optional[str] = None,
+    ) -> ManagedTask:
+        """
+        Register a job. Coroutine functions are handed to add_coro; blocking
+        callables run in the event loop's default executor.
+        """
+        if inspect.iscoroutinefunction(target):
+            return self.add_coro(target, args, kwargs, name=name)
+        if not callable(target):
+            raise TypeError("target must be callable")
+
+        call = functools.partial(target, *args, **(kwargs or {}))
+
+        def _in_executor() -> Awaitable[Any]:
+            return asyncio.get_running_loop().run_in_executor(self._executor, call)
+
+        return self._register(name or getattr(target, "__name__", "worker"), False, _in_executor)
+
+    async def start_all(self) -> List[str]:
+        """
+        Schedule all not-yet-started jobs on the running loop (skips if
+        cancel_event is set). Returns list of started names.
+        """
+        started: List[str] = []
+        if self.cancel_event.is_set():
+            self._log.warning("Cancel flag set; start_all skipped.")
+            return started
+        for item in list(self._items.values()):
+            if item.handle is None:
+                self._log.debug("Starting task: %s", item.name)
+                item.handle = asyncio.ensure_future(self._run(item))
+                started.append(item.name)
+        return started
+
+    async def join_all(self, timeout: Optional[float] = None) -> List[str]:
+        """
+        Wait for all started jobs. `timeout` is an overall budget.
+        Returns list of names still running afterwards.
+        """
+        pending = [
+            it.handle for it in list(self._items.values())
+            if it.handle is not None and not it.handle.done()
+        ]
+        if pending:
+            await asyncio.wait(pending, timeout=timeout)
+        return self.active_names()
+
+    def run(self, timeout: Optional[float] = None) -> List[str]:
+        """
+        Blocking helper: start everything and wait, using asyncio.run().
+        Must not be called from inside a running event loop.
+
+        Jobs still running when `timeout` expires are failed with
+        TimeoutError and their names are returned. Coroutines are cancelled;
+        a blocking callable can't be interrupted, so its thread is left to
+        finish in the background and its result is discarded.
+        """
+        # A private executor, so asyncio.run() doesn't wait for overrunning
+        # blocking jobs while shutting down the loop's default one
+        executor = self._executor = ThreadPoolExecutor(
+            thread_name_prefix=self.__class__.__name__
+        )
+        try:
+            return asyncio.run(self._gather(timeout))
+        finally:
+            self._executor = None
+            executor.shutdown(wait=False)
+
+    def get_result(self, name: str, *, rethrow: bool = True) -> Any:
+        """
+        Get a job's result. If an exception occurred and rethrow=True,
+        re-raise it; else return None and leave it recorded.
+        """
+        item = self._require(name)
+        if item.exception and rethrow:
+            raise item.exception
+        return item.result
+
+    def results(self) -> Dict[str, Any]:
+        """Return dict: name -> result (None if not set or errored)."""
+        return {n: it.result for n, it in list(self._items.items())}
+
+    def exceptions(self) -> Dict[str, Exception]:
+        """Return dict: name -> exception for jobs that raised."""
+        return {n: it.exception for n, it in list(self._items.items()) if it.exception is not None}
+
+    def active_names(self) -> List[str]:
+        """Names of currently running jobs."""
+        return [n for n, it in list(self._items.items()) if it.alive]
+
+    def all_names(self) -> List[str]:
+        """All registered job names."""
+        return list(self._items)
+
+    def is_all_done(self) -> bool:
+        """True if no jobs are running."""
+        return not any(it.alive for it in list(self._items.values()))
+
+    def cancel(self) -> None:
+        """
+        Set the cooperative cancel flag and cancel running coroutine tasks.
+        Jobs already running in the executor can only check the flag.
+        """
+        self.cancel_event.set()
+        for item in list(self._items.values()):
+            if item.is_coro and item.alive:
+                item.handle.cancel()
+
+    async def __aenter__(self) -> "AsyncThreadManager":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        self.cancel_event.set()
+        leftover = await self.join_all(timeout=5.0)
+        if leftover:
+            self._log.warning("Tasks still running on exit: %s", leftover)
+        return False
+
+    # ---------- Internal helpers ----------
+
+    async def _gather(self, timeout: Optional[float]) -> List[str]:
+        await self.start_all()
+        leftover = await self.join_all(timeout=timeout)
+        if leftover:
+            handles = []
+            for name in leftover:
+                item = self._items[name]
+                item.exception = TimeoutError(f"Task '{name}' did not finish within {timeout}s")
+                item.handle.cancel()
+                handles.append(item.handle)
+            await asyncio.wait(handles)
+        return leftover
+
+    async def _run(self, item: ManagedTask) -> None:
+        item.started = True
+        item.start_time = _now()
+        try:
+            item.result = await item.call()
+        except asyncio.CancelledError:
+            self._log.debug("Task %s cancelled", item.name)
+            raise
+        except Exception as exc:
+            item.exception = exc
+            self._log.exception("Task %s raised: %s", item.name, exc)
+        finally:
+            item.end_time = _now()
+
+    def _register(self, base: str, is_coro: bool, call: Callable[[], Awaitable[Any]]) -> ManagedTask:
+        item = ManagedTask(name=base, is_coro=is_coro, call=call)
+        item.name = _claim_name(self._items, self._name_counts, base, item)
+        return item
+
+    def _require(self, name: str) -> ManagedTask:
+        item = self._items.get(name)
+        if item is None:
+            raise KeyError(f"No task named '{name}'")
+        return item
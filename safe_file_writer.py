@@ -1,24 +1,78 @@
+import codecs
+import io
+import itertools
+import os
+import queue
+import shutil
 import threading
 import logging
 from pathlib import Path
-from typing import Union, Sequence
+from typing import Optional, Tuple, Union, Sequence
+
+_MERGE_BUFSIZE = 1024 * 1024
+_FLUSH_POLL = 0.1  # seconds between writer liveness checks in QueuedFileWriter.flush
+
+# str.encode() with these codecs puts a BOM in front of every call; writes
+# use the BOM-less codec instead and the BOM is written once per file.
+_BOM_FREE = {
+    codecs.BOM_UTF8: "utf-8",
+    codecs.BOM_UTF16_LE: "utf-16-le",
+    codecs.BOM_UTF16_BE: "utf-16-be",
+    codecs.BOM_UTF32_LE: "utf-32-le",
+    codecs.BOM_UTF32_BE: "utf-32-be",
+}
+
+
+def _split_bom(encoding: str) -> Tuple[bytes, str]:
+    """Return (BOM the codec starts a stream with, codec for the text after it)."""
+    bom = codecs.getincrementalencoder(encoding)().encode("")
+    if not bom:
+        return bom, encoding
+    try:
+        return bom, _BOM_FREE[bom]
+    except KeyError:
+        raise ValueError(f"Unsupported encoding with a byte order mark: {encoding}") from None
 
 
 class SafeFileWriter:
     """
     Thread-safe utility for writing to a file.
     Can handle strings or sequences of strings.
+
+    The file is opened once in binary mode and kept open until close() (or
+    the end of a with-block). write() encodes the data itself and appends the
+    bytes to the buffered handle, so there is no per-write open/close and no
+    TextIOWrapper layer.
     """
 
-    def __init__(self, file_path: Union[str, Path], encoding: str = "utf-8"):
+    def __init__(
+        self,
+        file_path: Union[str, Path],
+        encoding: str = "utf-8",
+        flush_every: int = 1,
+    ):
         """
         Args:
             file_path: Path to the file to write.
-            encoding: Encoding used to open the file.
+            encoding: Encoding used for the written text.
+            flush_every: Flush the buffer after this many writes.
+                Use 0 to flush only when the buffer fills up or on close().
         """
         self.file_path = Path(file_path)
         self.encoding = encoding
+        self.flush_every = flush_every
+        self._bom, self._codec = _split_bom(encoding)
+        self._newline = "\n".encode(self._codec)
         self._lock = threading.Lock()
+        self._pending = 0
+        with self._lock:
+            self._fh = open(self.file_path, "ab", buffering=io.DEFAULT_BUFFER_SIZE)
+            if self._bom and self._fh.tell() == 0:
+                self._fh.write(self._bom)
+
+    @property
+    def closed(self) -> bool:
+        return self._fh.closed
 
     def write(self, data: Union[str, Sequence[str]], add_newline: bool = True) -> None:
         """
@@ -28,24 +82,329 @@ class SafeFileWriter:
             data: String or sequence of strings to write.
             add_newline: Whether to append a newline after each entry.
         """
+        if add_newline and data.__class__ is str:
+            # Common logging shape: skip the generic helpers
+            self._append((data.encode(self._codec), self._newline))
+        else:
+            self._append(self._encode(data, add_newline))
+
+    def write_bytes(self, data: bytes, add_newline: bool = True) -> None:
+        """
+        Write already-encoded data to the file, skipping the encode step.
+
+        Args:
+            data: Bytes to write.
+            add_newline: Whether to append a newline after the data.
+        """
+        self._append(self._line(data, add_newline))
+
+    def flush(self, durable: bool = False) -> None:
+        """
+        Flush buffered data to the OS.
+
+        write() returns once the data is in Python's buffer; call
+        flush(durable=True) when you need crash-safety, which also fsyncs
+        the file. write() itself never fsyncs.
+        """
+        with self._lock:
+            self._fh.flush()
+            self._pending = 0
+            if durable:
+                os.fsync(self._fh.fileno())
+
+    def close(self) -> None:
+        """Flush buffered data and close the underlying file."""
+        with self._lock:
+            if not self._fh.closed:
+                self._fh.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    # ---------- Internal helpers ----------
+
+    def _encode(self, data: Union[str, Sequence[str]], add_newline: bool) -> Tuple[bytes, ...]:
+        text = data if isinstance(data, str) else "\n".join(data)
+        return self._line(text.encode(self._codec), add_newline)
+
+    def _line(self, buf: bytes, add_newline: bool) -> Tuple[bytes, ...]:
+        # The newline is kept as a separate chunk rather than concatenated,
+        # which would copy the whole payload once more.
+        return (buf, self._newline) if add_newline else (buf,)
+
+    def _append(self, chunks: Sequence[bytes], count: int = 1) -> None:
+        """Append encoded chunks; `count` is the number of writes they hold."""
         with self._lock:
             try:
-                with self.file_path.open("a", encoding=self.encoding) as f:
-                    if isinstance(data, str):
-                        f.write(data + ("\n" if add_newline else ""))
-                    else:
-                        f.write(
-                            "\n".join(data) + ("\n" if add_newline else "")
-                        )
+                self._fh.writelines(chunks)
+                self._pending += count
+                if self.flush_every and self._pending >= self.flush_every:
+                    self._fh.flush()
+                    self._pending = 0
             except OSError as e:
                 logging.error(
-                    f"Failed to write to file {self.file_path}: {e}",
+                    "Failed to write to file %s: %s", self.file_path, e,
                     exc_info=True
                 )
 
+
+class _FlushRequest:
+    """Queue marker asking QueuedFileWriter's writer thread to flush."""
+
+    __slots__ = ("durable", "done", "error")
+
+    def __init__(self, durable: bool):
+        self.durable = durable
+        self.done = threading.Event()
+        self.error: Optional[Exception] = None
+
+
+class QueuedFileWriter(SafeFileWriter):
+    """
+    SafeFileWriter variant that hands writes to a single background thread.
+
+    write() only formats and encodes the data and puts it on a
+    queue.SimpleQueue, so producers never wait on the file lock. The writer
+    thread drains whatever has accumulated and appends it with one write()
+    call. Order is preserved per producer; call close() (or use a with-block)
+    to drain the queue.
+    """
+
+    _CLOSE = object()
+
+    def __init__(
+        self,
+        file_path: Union[str, Path],
+        encoding: str = "utf-8",
+        flush_every: int = 1,
+    ):
+        """
+        Args:
+            file_path: Path to the file to write.
+            encoding: Encoding used for the written text.
+            flush_every: Flush the buffer after this many writes (counted
+                per message, checked once per drained batch).
+                Use 0 to flush only when the buffer fills up or on close().
+        """
+        super().__init__(file_path, encoding=encoding, flush_every=flush_every)
+        self._closing = False
+        self._put_lock = threading.Lock()  # orders puts against close()'s sentinel
+        self._q: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._writer = threading.Thread(
+            target=self._drain,
+            name=f"{self.__class__.__name__}-{self.file_path.name}",
+            daemon=True,
+        )
+        self._writer.start()
+
+    def write(self, data: Union[str, Sequence[str]], add_newline: bool = True) -> None:
+        """
+        Queue data for writing; returns without touching the file.
+
+        Args:
+            data: String or sequence of strings to write.
+            add_newline: Whether to append a newline after each entry.
+        """
+        if add_newline and data.__class__ is str:
+            self._put((data.encode(self._codec), self._newline))
+        else:
+            self._put(self._encode(data, add_newline))
+
+    def write_bytes(self, data: bytes, add_newline: bool = True) -> None:
+        """
+        Queue already-encoded data for writing.
+
+        Args:
+            data: Bytes to write.
+            add_newline: Whether to append a newline after the data.
+        """
+        # Checked here so a bad argument fails in the caller, not in the writer thread
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            raise TypeError(
+                f"write_bytes() argument must be bytes-like, not {type(data).__name__}"
+            )
+        self._put(self._line(data, add_newline))
+
+    def flush(self, durable: bool = False) -> None:
+        """
+        Wait until everything queued so far is written, then flush it.
+
+        With durable=True the file is also fsynced. Raises RuntimeError if
+        the writer thread is no longer running.
+        """
+        request = _FlushRequest(durable)
+        self._put(request)
+        # Recheck the writer now and then rather than wait on a dead thread
+        while not request.done.wait(_FLUSH_POLL):
+            if not self._writer.is_alive() and not request.done.is_set():
+                raise RuntimeError(f"Writer thread for {self.file_path} is not running")
+        if request.error is not None:
+            raise request.error
+
+    def close(self) -> None:
+        """Drain queued writes, stop the writer thread and close the file."""
+        with self._put_lock:
+            already_closing = self._closing
+            self._closing = True
+            if not already_closing:
+                self._q.put(self._CLOSE)
+        self._writer.join()
+        super().close()
+
+    def _put(self, item: Union[Tuple[bytes, ...], _FlushRequest]) -> None:
+        # Nothing can be queued behind the close sentinel
+        with self._put_lock:
+            if self._closing:
+                raise ValueError(f"Writer for {self.file_path} is closed")
+            self._q.put(item)
+
+    def _drain(self) -> None:
+        while True:
+            batch = [self._q.get()]
+            while True:
+                try:
+                    batch.append(self._q.get_nowait())
+                except queue.Empty:
+                    break
+            chunks: list = []
+            count = 0
+            for item in batch:
+                if isinstance(item, tuple):
+                    chunks.extend(item)
+                    count += 1
+                    continue
+                # Marker: write what came before it first
+                if chunks:
+                    self._append_batch(chunks, count)
+                    chunks, count = [], 0
+                if item is self._CLOSE:
+                    return
+                try:
+                    super().flush(item.durable)
+                except Exception as e:
+                    item.error = e
+                finally:
+                    item.done.set()
+            if chunks:
+                self._append_batch(chunks, count)
+
+    def _append_batch(self, chunks: Sequence[bytes], count: int) -> None:
+        # _append already logs OSError; anything else must not stop the
+        # writer thread, or later writes and flushes would be stranded
+        try:
+            self._append(chunks, count=count)
+        except Exception:
+            logging.exception(
+                "Failed to write %d queued entries to %s", count, self.file_path
+            )
+
+
+class ShardedFileWriter:
+    """
+    Thread-safe writer that spreads writes over several shard files.
+
+    Each thread is pinned to one shard (`<file_path>.<i>`) the first time it
+    writes, so threads only contend on the lock of their own shard. Ordering
+    is kept per thread, not across threads. finalize() (also run at the end
+    of a with-block) appends all shards to `file_path` and removes them.
+    Shard files are truncated when the writer is created, so leftovers from
+    an earlier run that never finalized are discarded.
+    """
+
+    def __init__(
+        self,
+        file_path: Union[str, Path],
+        encoding: str = "utf-8",
+        flush_every: int = 1,
+        shards: Optional[int] = None,
+    ):
+        """
+        Args:
+            file_path: Path to the final, merged file.
+            encoding: Encoding used for the written text.
+            flush_every: Flush each shard's buffer after this many writes.
+            shards: Number of shard files; defaults to os.cpu_count().
+        """
+        self.file_path = Path(file_path)
+        self.encoding = encoding
+        count = shards or os.cpu_count() or 1
+        self._shards = []
+        for i in range(count):
+            path = self.shard_path(i)
+            # SafeFileWriter appends; start each shard from empty
+            path.write_bytes(b"")
+            self._shards.append(
+                SafeFileWriter(path, encoding=encoding, flush_every=flush_every)
+            )
+        self._local = threading.local()
+        self._next_shard = itertools.count()
+
+    def shard_path(self, index: int) -> Path:
+        return self.file_path.with_name(f"{self.file_path.name}.{index}")
+
+    def write(self, data: Union[str, Sequence[str]], add_newline: bool = True) -> None:
+        """
+        Write data to the calling thread's shard.
+
+        Args:
+            data: String or sequence of strings to write.
+            add_newline: Whether to append a newline after each entry.
+        """
+        self._shard().write(data, add_newline)
+
+    def write_bytes(self, data: bytes, add_newline: bool = True) -> None:
+        """
+        Write already-encoded data to the calling thread's shard.
+
+        Args:
+            data: Bytes to write.
+            add_newline: Whether to append a newline after the data.
+        """
+        self._shard().write_bytes(data, add_newline)
+
+    def flush(self, durable: bool = False) -> None:
+        """Flush every shard; with durable=True also fsync them."""
+        for shard in self._shards:
+            shard.flush(durable)
+
+    def close(self) -> None:
+        """Close all shard files without merging them."""
+        for shard in self._shards:
+            shard.close()
+
+    def finalize(self) -> Path:
+        """Close the shards, append them to `file_path` in order and delete them."""
+        self.close()
+        bom = self._shards[0]._bom
+        with self.file_path.open("ab") as out:
+            if bom and out.tell() == 0:
+                out.write(bom)
+            for shard in self._shards:
+                if not shard.file_path.exists():
+                    continue
+                with shard.file_path.open("rb") as src:
+                    # Every shard starts with its own BOM; keep only the first
+                    if src.read(len(bom)) != bom:
+                        src.seek(0)
+                    shutil.copyfileobj(src, out, _MERGE_BUFSIZE)
+                shard.file_path.unlink()
+        return self.file_path
+
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
-        # Nothing to clean up — file is handled per write call
+        self.finalize()
         return False
+
+    def _shard(self) -> SafeFileWriter:
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._shards[next(self._next_shard) % len(self._shards)]
+            self._local.shard = shard
+            return shard
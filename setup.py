@@ -8,6 +8,9 @@ setup(
     author="Your Name",
     author_email="your.email@example.com",
     packages=find_packages(),
+    extras_require={
+        "fast": ["fastrlock"],
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
@@ -1,8 +1,10 @@
+import heapq
+import inspect
 import threading
+from concurrent.futures import ThreadPoolExecutor, wait
 import logging
 import time
-from queue import PriorityQueue
-from typing import Callable, Any
+from typing import Callable, Any, Optional
 from rich.console import Console
 from rich.progress import Progress, BarColumn, TextColumn, SpinnerColumn
 from rich.theme import Theme
@@ -20,11 +22,32 @@ custom_theme = Theme({
 })
 console = Console(theme=custom_theme)
 
+# Progress callbacks push to Rich at most every N ticks or every T seconds
+PROGRESS_BATCH = 16
+PROGRESS_INTERVAL = 0.05
+
+def _accepts_progress(target: Callable) -> bool:
+    # Only an explicit `progress` parameter counts; **kwargs targets often
+    # forward their kwargs elsewhere (e.g. to an LLM client).
+    try:
+        params = inspect.signature(target).parameters
+    except (TypeError, ValueError):
+        return False
+    param = params.get("progress")
+    return param is not None and param.kind in (
+        inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        inspect.Parameter.KEYWORD_ONLY,
+    )
+
 class ThreadManager:
     def __init__(self, max_workers: int = 5):
         self.max_workers = max_workers
-        self.thread_pool = PriorityQueue()
+        self._heap = []  # (priority, seq, name); seq keeps FIFO order for equal priorities
+        self._heap_lock = threading.Lock()
+        self._seq = 0
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="tm")
         self.threads = {}
+        self._retry_counts = {}  # original task name -> retries scheduled so far
         self.progress = Progress(
             SpinnerColumn(),
             TextColumn("{task.description}"),
@@ -34,64 +57,95 @@ class ThreadManager:
             transient=True,
         )
 
-    def add_task(self, name: str, target: Callable, args: tuple = (), kwargs: dict = None, priority: int = 0, total: int = 100):
+    def add_task(self, name: str, target: Callable, args: tuple = (), kwargs: dict = None, priority: int = 0, total: int = 100, report_progress: Optional[bool] = None):
+        """
+        Queue `target(*args, **kwargs)` to run once on the worker pool.
+
+        The progress bar is `total` steps long and is filled when the target
+        returns. Targets that take a `progress` parameter are also called with
+        a `progress` keyword: call `progress()` (or `progress(n)`) to advance
+        the bar while it works. report_progress=True/False overrides the
+        detection.
+        """
         if name in self.threads:
-            logging.warning(f"Thread with name '{name}' already exists. Skipping.")
+            logging.warning("Thread with name '%s' already exists. Skipping.", name)
             return
 
-        kwargs = kwargs or {}
-        kwargs["total"] = total  # Pass total to the task's kwargs
+        if report_progress is None:
+            report_progress = _accepts_progress(target)
 
-        thread = threading.Thread(target=self._wrapper, name=name, args=(target, name) + args, kwargs=kwargs)
         self.threads[name] = {
-            "thread": thread,
-            "priority": priority,
+            "spec": (target, args, kwargs or {}, priority),  # reused by retry_failed_tasks
+            "retry_of": None,
+            "retried": False,
+            "future": None,
             "progress_id": None,
+            "total": total,
+            "report_progress": report_progress,
             "failed": False,
         }
-        self.thread_pool.put((priority, name))
+        with self._heap_lock:
+            heapq.heappush(self._heap, (priority, self._seq, name))
+            self._seq += 1
 
 
-    def _wrapper(self, target: Callable, name: str, *args, **kwargs):
-        task_id = self.threads[name]["progress_id"]
-        total = kwargs.pop("total", 100)  # Use the provided total or default to 100
+    def _wrapper(self, name: str):
+        info = self.threads[name]
+        task_id = self.progress.add_task(name, total=info["total"])
+        info["progress_id"] = task_id
+        target, args, kwargs, _ = info["spec"]
+        if info["report_progress"]:
+            kwargs = dict(kwargs, progress=self._make_progress_cb(task_id))
 
         try:
-            for _ in range(total):
-                time.sleep(0.1)
-                self.progress.update(task_id, advance=1)
-                target(*args, **kwargs)
+            target(*args, **kwargs)
         except Exception as e:
             self.threads[name]["failed"] = True
-            logging.error(f"Thread {name} failed: {e}")
+            logging.error("Thread %s failed: %s", name, e)
         finally:
-            self.progress.update(task_id, completed=total)  # Mark the task as completed
-            logging.info(f"Thread {name} finished.")
+            self.progress.update(task_id, completed=info["total"])  # Mark the task as completed
+            logging.info("Thread %s finished.", name)
+
+
+    def _make_progress_cb(self, task_id):
+        # Batch advances so Rich's lock is taken once per PROGRESS_BATCH ticks;
+        # whatever is left over is covered by the final completed=total update.
+        pending = 0
+        last = time.monotonic()
+
+        def advance(n: int = 1):
+            nonlocal pending, last
+            pending += n
+            now = time.monotonic()
+            if pending >= PROGRESS_BATCH or now - last > PROGRESS_INTERVAL:
+                self.progress.update(task_id, advance=pending)
+                pending = 0
+                last = now
+
+        return advance
 
 
     def run(self):
-        active_threads = []
+        futures = []
 
         with self.progress:
-            while not self.thread_pool.empty() or active_threads:
-                active_threads = [t for t in active_threads if t.is_alive()]
+            # The pool runs submissions in FIFO order, so submitting in heap
+            # order keeps the priorities; at most max_workers run at once.
+            while self._heap:
+                with self._heap_lock:
+                    _, _, name = heapq.heappop(self._heap)
+                future = self._pool.submit(self._wrapper, name)
+                self.threads[name]["future"] = future
+                futures.append(future)
 
-                while len(active_threads) < self.max_workers and not self.thread_pool.empty():
-                    _, name = self.thread_pool.get()
-                    thread = self.threads[name]["thread"]
-                    progress_id = self.progress.add_task(name, total=100)
-                    self.threads[name]["progress_id"] = progress_id
-                    thread.start()
-                    active_threads.append(thread)
-
-                time.sleep(0.1)
+            wait(futures)
 
         logging.info("All threads finished.")
 
     def get_status(self):
         return {
             name: {
-                "is_alive": thread_info["thread"].is_alive(),
+                "is_alive": thread_info["future"] is not None and thread_info["future"].running(),
                 "progress": self.progress.tasks[thread_info["progress_id"]].completed
                 if thread_info["progress_id"] is not None else 0,
                 "failed": thread_info["failed"],
@@ -100,16 +154,31 @@ class ThreadManager:
         }
 
     def retry_failed_tasks(self):
-        for name, info in self.threads.items():
-            if info["failed"]:
-                logging.info(f"Retrying thread {name}")
+        for name, info in list(self.threads.items()):
+            if info["failed"] and not info["retried"]:
+                # Retries of retries are numbered from the original task
+                origin = info["retry_of"] or name
+                count = self._retry_counts.get(origin, 0) + 1
+                retry_name = f"{origin}#r{count}"
+                # Don't collide with (and then relabel) an unrelated task
+                while retry_name in self.threads:
+                    count += 1
+                    retry_name = f"{origin}#r{count}"
+                self._retry_counts[origin] = count
+
+                logging.info("Retrying thread %s as %s", name, retry_name)
+                target, args, kwargs, priority = info["spec"]
                 self.add_task(
-                    name=f"{name}_retry",
-                    target=info["thread"]._target,
-                    args=info["thread"]._args[2:],
-                    kwargs=info["thread"]._kwargs,
-                    priority=info["priority"],
+                    name=retry_name,
+                    target=target,
+                    args=args,
+                    kwargs=kwargs,
+                    priority=priority,
+                    total=info["total"],
+                    report_progress=info["report_progress"],
                 )
+                self.threads[retry_name]["retry_of"] = origin
+                info["retried"] = True
         self.run()
 
     def run_llm_tasks(self, llm_function: Callable, prompts: list, **kwargs):
@@ -123,9 +192,13 @@ class ThreadManager:
             )
         self.run()
 
+    def shutdown(self, wait: bool = True):
+        """Stop the worker pool; the manager can't run tasks afterwards."""
+        self._pool.shutdown(wait=wait)
+
 def example_task(name: str, duration: int):
     for i in range(duration):
-        logging.info(f"{name} - Task iteration {i + 1}/{duration}")
+        logging.info("%s - Task iteration %d/%d", name, i + 1, duration)
         time.sleep(1)
 
 def example_llm_function(prompt: str):
@@ -0,0 +1,61 @@
+import asyncio
+import functools
+import time
+import unittest
+from easythreads import AsyncThreadManager
+
+class TestAsyncThreadManager(unittest.TestCase):
+    def test_mixed_execution(self):
+        """Coroutines and blocking callables both run and report results."""
+        async def double(x):
+            await asyncio.sleep(0)
+            return x * 2
+
+        def fail():
+            raise ValueError("boom")
+
+        manager = AsyncThreadManager()
+        for i in range(3):
+            manager.add_coro(double, (i,), name="double")
+        manager.add_thread(functools.partial(double, 5), name="partial")
+        manager.add_thread(sum, ([1, 2, 3],))
+        manager.add_thread(fail)
+
+        self.assertEqual(manager.run(), [])
+        self.assertEqual(
+            manager.results(),
+            {"double": 0, "double-2": 2, "double-3": 4, "partial": 10, "sum": 6, "fail": None},
+        )
+        self.assertIsInstance(manager.exceptions()["fail"], ValueError)
+
+    def test_run_timeout(self):
+        """Jobs that overrun run()'s timeout fail with TimeoutError; run() doesn't wait for them."""
+        manager = AsyncThreadManager()
+        manager.add_coro(asyncio.sleep, (10,), name="slow_coro")
+        manager.add_thread(time.sleep, (0.5,), name="slow_call")
+        manager.add_thread(sum, ([1, 2],))
+
+        start = time.monotonic()
+        leftover = manager.run(timeout=0.05)
+
+        self.assertLess(time.monotonic() - start, 0.4)
+        self.assertEqual(sorted(leftover), ["slow_call", "slow_coro"])
+        self.assertEqual(manager.results()["sum"], 3)
+        self.assertEqual(sorted(manager.exceptions()), ["slow_call", "slow_coro"])
+        for exc in manager.exceptions().values():
+            self.assertIsInstance(exc, TimeoutError)
+
+    def test_cancel(self):
+        """cancel() stops running coroutines and sets the cancel flag."""
+        async def main():
+            manager = AsyncThreadManager()
+            manager.add_coro(asyncio.sleep, (10,), name="sleeper")
+            await manager.start_all()
+            await asyncio.sleep(0)
+            manager.cancel()
+            self.assertEqual(await manager.join_all(timeout=1.0), [])
+            self.assertTrue(manager.cancel_event.is_set())
+            self.assertTrue(manager.is_all_done())
+            self.assertEqual(await manager.start_all(), [])
+
+        asyncio.run(main())
@@ -0,0 +1,64 @@
+import importlib.util
+import os
+import unittest
+
+# The Rich-based manager lives in the top-level test.py, which would clash
+# with the stdlib `test` package if imported by name
+_spec = importlib.util.spec_from_file_location(
+    "rich_thread_manager", os.path.join(os.path.dirname(__file__), os.pardir, "test.py")
+)
+rich_thread_manager = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(rich_thread_manager)
+
+class TestRichThreadManager(unittest.TestCase):
+    def setUp(self):
+        self.manager = rich_thread_manager.ThreadManager(max_workers=2)
+
+    def tearDown(self):
+        self.manager.shutdown()
+
+    def test_run_and_retries(self):
+        """Targets run once; failed tasks are retried as name#rN until they succeed."""
+        calls = {"flaky": 0, "steady": 0}
+
+        def flaky():
+            calls["flaky"] += 1
+            if calls["flaky"] < 3:
+                raise RuntimeError("try again")
+
+        def steady(progress):
+            calls["steady"] += 1
+            progress(10)
+
+        self.manager.add_task("flaky", flaky)
+        self.manager.add_task("steady", steady, total=10)
+        self.manager.run()
+
+        self.assertEqual(calls, {"flaky": 1, "steady": 1})
+        status = self.manager.get_status()
+        self.assertTrue(status["flaky"]["failed"])
+        self.assertFalse(status["steady"]["failed"])
+        self.assertEqual(status["steady"]["progress"], 10)
+
+        self.manager.retry_failed_tasks()
+        self.manager.retry_failed_tasks()
+
+        self.assertEqual(calls, {"flaky": 3, "steady": 1})
+        status = self.manager.get_status()
+        self.assertEqual(sorted(status), ["flaky", "flaky#r1", "flaky#r2", "steady"])
+        self.assertTrue(status["flaky#r1"]["failed"])
+        self.assertFalse(status["flaky#r2"]["failed"])
+        self.assertEqual(self.manager.threads["flaky#r2"]["retry_of"], "flaky")
+
+    def test_retry_name_collision(self):
+        """A retry skips names already taken by other tasks and leaves them alone."""
+        def fail():
+            raise RuntimeError("boom")
+
+        self.manager.add_task("job#r1", lambda: None)
+        self.manager.add_task("job", fail)
+        self.manager.run()
+        self.manager.retry_failed_tasks()
+
+        self.assertIsNone(self.manager.threads["job#r1"]["retry_of"])
+        self.assertEqual(self.manager.threads["job#r2"]["retry_of"], "job")
@@ -0,0 +1,169 @@
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+from pathlib import Path
+from easythreads import SafeFileWriter, QueuedFileWriter, ShardedFileWriter
+
+class TempFileTestCase(unittest.TestCase):
+    """Gives each test a fresh temp directory and `self.path` inside it."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmp.name, "out.txt")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def read(self):
+        with open(self.path, encoding="utf-8") as f:
+            return f.read()
+
+class TestSafeFileWriter(TempFileTestCase):
+    def test_bom_written_once(self):
+        """Encodings with a BOM get it once at the start of the file, across reopens."""
+        for encoding in ("utf-16", "utf-8-sig"):
+            with self.subTest(encoding=encoding):
+                if os.path.exists(self.path):
+                    os.remove(self.path)
+                with SafeFileWriter(self.path, encoding=encoding) as writer:
+                    writer.write("ab")
+                with SafeFileWriter(self.path, encoding=encoding) as writer:
+                    writer.write(["cd", "é"])
+
+                with open(self.path, encoding=encoding) as f:
+                    self.assertEqual(f.read(), "ab\ncd\né\n")
+
+class TestQueuedFileWriter(TempFileTestCase):
+    def test_order_kept_per_producer(self):
+        """Each producer's lines reach the file in the order it wrote them."""
+        def produce(writer, tag):
+            for i in range(200):
+                writer.write(f"{tag} {i}")
+
+        with QueuedFileWriter(self.path, flush_every=0) as writer:
+            producers = [threading.Thread(target=produce, args=(writer, t)) for t in "abc"]
+            for t in producers:
+                t.start()
+            for t in producers:
+                t.join()
+
+        lines = self.read().splitlines()
+        self.assertEqual(len(lines), 600)
+        for tag in "abc":
+            mine = [int(line.split()[1]) for line in lines if line.startswith(tag)]
+            self.assertEqual(mine, list(range(200)))
+
+    def test_flush_writes_queued_data(self):
+        """flush() returns only once everything queued before it is in the file."""
+        writer = QueuedFileWriter(self.path, flush_every=0)
+        try:
+            writer.write(["one", "two"])
+            writer.write_bytes(b"three")
+            writer.flush()
+            self.assertEqual(self.read(), "one\ntwo\nthree\n")
+        finally:
+            writer.close()
+
+    def test_durable_flush(self):
+        """flush(durable=True) fsyncs the file after writing the queue."""
+        with QueuedFileWriter(self.path, flush_every=0) as writer:
+            writer.write("one")
+            with mock.patch("os.fsync") as fsync:
+                writer.flush(durable=True)
+            fsync.assert_called_once_with(writer._fh.fileno())
+            self.assertEqual(self.read(), "one\n")
+
+    def test_flush_with_dead_writer_raises(self):
+        """flush() raises instead of waiting on a writer thread that has stopped."""
+        writer = QueuedFileWriter(self.path)
+        writer._q.put(writer._CLOSE)
+        writer._writer.join()
+        try:
+            with self.assertRaises(RuntimeError):
+                writer.flush()
+        finally:
+            writer.close()
+
+    def test_close_drains_queue(self):
+        """close() writes whatever is still queued; later writes are refused."""
+        writer = QueuedFileWriter(self.path, flush_every=0)
+        for i in range(1000):
+            writer.write(str(i))
+        writer.close()
+
+        self.assertEqual(self.read().splitlines(), [str(i) for i in range(1000)])
+        with self.assertRaises(ValueError):
+            writer.write("late")
+        with self.assertRaises(ValueError):
+            writer.flush()
+
+    def test_bad_write_fails_in_caller(self):
+        """A bad write raises in the caller and the writer keeps working."""
+        with QueuedFileWriter(self.path) as writer:
+            with self.assertRaises(TypeError):
+                writer.write_bytes("not bytes")
+            writer.write("after")
+            writer.flush()
+            self.assertTrue(writer._writer.is_alive())
+
+        self.assertEqual(self.read(), "after\n")
+
+    def test_writer_survives_failed_batch(self):
+        """An error while appending a batch doesn't stop the writer thread."""
+        with QueuedFileWriter(self.path) as writer:
+            writer._put(("not bytes",))
+            writer.flush()
+            writer.write("after")
+            writer.flush()
+
+        self.assertEqual(self.read(), "after\n")
+
+class TestShardedFileWriter(TempFileTestCase):
+    def test_finalize_merges_and_removes_shards(self):
+        """All threads' lines end up in file_path; the shard files are gone."""
+        def produce(writer, tag):
+            for i in range(50):
+                writer.write(f"{tag} {i}")
+            writer.write_bytes(tag.encode())
+            writer.flush()
+
+        writer = ShardedFileWriter(self.path, flush_every=0, shards=2)
+        producers = [threading.Thread(target=produce, args=(writer, t)) for t in "abcd"]
+        for t in producers:
+            t.start()
+        for t in producers:
+            t.join()
+        shard_paths = [writer.shard_path(i) for i in range(2)]
+        self.assertTrue(all(p.exists() for p in shard_paths))
+        self.assertEqual(writer.finalize(), Path(self.path))
+
+        self.assertFalse(any(p.exists() for p in shard_paths))
+        lines = self.read().splitlines()
+        for tag in "abcd":
+            mine = [line for line in lines if line.startswith(tag)]
+            self.assertEqual(mine, [f"{tag} {i}" for i in range(50)] + [tag])
+
+    def test_stale_shards_discarded(self):
+        """Shards left behind by an earlier run don't leak into the output."""
+        stale = ShardedFileWriter(self.path, shards=1)
+        stale.write("stale")
+        stale.close()
+
+        with ShardedFileWriter(self.path, shards=1) as writer:
+            writer.write("fresh")
+
+        self.assertEqual(self.read(), "fresh\n")
+
+    def test_merge_keeps_one_bom(self):
+        """finalize() drops the shards' own BOMs and keeps the output's."""
+        with ShardedFileWriter(self.path, encoding="utf-16", shards=3) as writer:
+            writers = [threading.Thread(target=writer.write, args=(t,)) for t in "abc"]
+            for t in writers:
+                t.start()
+            for t in writers:
+                t.join()
+
+        with open(self.path, encoding="utf-16") as f:
+            self.assertEqual(sorted(f.read().splitlines()), ["a", "b", "c"])
@@ -1,4 +1,9 @@
+import functools
+import importlib.util
+import threading
+import time
 import unittest
+from unittest import mock
 from easythreads import ThreadManager
 
 class TestThreadManager(unittest.TestCase):
@@ -16,4 +21,182 @@ class TestThreadManager(unittest.TestCase):
         manager.start_all()
         manager.join_all()
 
-        self.assertEqual(sorted(results), [0, 1, 2, 3, 4])
\ No newline at end of file
+        self.assertEqual(sorted(results), [0, 1, 2, 3, 4])
+
+    def test_remove_completed(self):
+        """Finished threads are removed once; unstarted ones are kept."""
+        manager = ThreadManager()
+        manager.add_thread(target=lambda: None, name="done")
+        manager.start_all()
+        manager.join_all()
+        manager.add_thread(target=lambda: None, name="pending")
+
+        self.assertEqual(manager.remove_completed(), ["done"])
+        self.assertEqual(manager.remove_completed(), [])
+        self.assertEqual(manager.all_names(), ["pending"])
+
+    def test_failed_start_can_be_retried(self):
+        """Threads whose start failed, and the ones after them, can be started later."""
+        manager = ThreadManager()
+        items = [manager.add_thread(target=lambda: None, name=n) for n in "abc"]
+        with mock.patch.object(items[1].thread, "start", side_effect=RuntimeError("can't start new thread")):
+            with self.assertRaises(RuntimeError):
+                manager.start_all()
+
+        self.assertEqual([it.started for it in items], [True, False, False])
+        self.assertEqual(manager.join_all(timeout=5.0), [])
+        self.assertEqual(manager.start_all(), ["b", "c"])
+        self.assertEqual(manager.join_all(timeout=5.0), [])
+        self.assertEqual(manager.results(), {"a": None, "b": None, "c": None})
+
+    def test_results_view_cached_and_refreshed(self):
+        """results()/exceptions() are cached read-only views, rebuilt after finish, add and remove."""
+        go = threading.Event()
+
+        def worker():
+            go.wait(5.0)
+            return 42
+
+        manager = ThreadManager()
+        manager.add_thread(target=worker)
+        before = manager.results()
+        self.assertEqual(before, {"worker": None})
+        self.assertIs(manager.results(), before)
+        with self.assertRaises(TypeError):
+            before["other"] = 1
+
+        manager.start_all()
+        go.set()
+        manager.join_all()
+        finished = manager.results()
+        self.assertEqual(finished, {"worker": 42})
+        self.assertEqual(before, {"worker": None})
+        self.assertIs(manager.results(), finished)
+
+        manager.add_thread(target=lambda: None, name="later")
+        self.assertEqual(manager.results(), {"worker": 42, "later": None})
+
+        manager.remove_completed()
+        self.assertEqual(manager.results(), {"later": None})
+        self.assertEqual(manager.exceptions(), {})
+        with self.assertRaises(TypeError):
+            manager.exceptions()["later"] = ValueError()
+
+    def test_unsafe_thread_records_result(self):
+        """safe=False threads still record their result and finish."""
+        manager = ThreadManager()
+        manager.add_thread(target=sum, args=([1, 2],), safe=False)
+        manager.start_all()
+
+        self.assertEqual(manager.join_all(timeout=5.0), [])
+        self.assertEqual(manager.get_result("sum"), 3)
+
+    def test_exit_waits_only_for_started_threads(self):
+        """Leaving a with-block waits for started threads and ignores unstarted ones."""
+        manager = ThreadManager()
+        begin = time.monotonic()
+        with manager:
+            short = manager.add_thread(target=time.sleep, args=(0.1,), name="short")
+            manager.start_all()
+            manager.add_thread(target=lambda: None, name="never")
+        elapsed = time.monotonic() - begin
+
+        self.assertLess(elapsed, 2.0)
+        self.assertTrue(short.done.is_set())
+        self.assertFalse(short.alive)
+        self.assertTrue(manager.cancel_event.is_set())
+        self.assertEqual(manager.active_names(), [])
+
+    def test_cancel_event_passed_to_worker(self):
+        """Workers that take `cancel_event` receive the manager's event."""
+        seen = []
+
+        def worker(cancel_event):
+            seen.append(cancel_event)
+
+        manager = ThreadManager()
+        manager.add_thread(target=worker)
+        manager.start_all()
+        manager.join_all()
+
+        self.assertEqual(seen, [manager.cancel_event])
+
+    def test_cancel_event_from_caller_kept(self):
+        """A cancel_event the caller passes, by keyword or positionally, is not replaced."""
+        seen = []
+
+        def worker(x, cancel_event):
+            seen.append(cancel_event)
+
+        mine = threading.Event()
+        manager = ThreadManager()
+        manager.add_thread(target=worker, args=(1,), kwargs={"cancel_event": mine})
+        manager.add_thread(target=worker, args=(2, mine))
+        manager.add_thread(target=worker, args=(3,))
+        manager.add_thread(target=functools.partial(worker, 4, cancel_event=mine))
+        manager.start_all()
+        manager.join_all()
+
+        self.assertEqual(manager.exceptions(), {})
+        self.assertEqual(seen.count(mine), 3)
+        self.assertEqual(seen.count(manager.cancel_event), 1)
+
+    def test_cancel_event_bound_and_plain_method(self):
+        """A method works as target bound or plain, whichever is added first."""
+        for bound_first in (True, False):
+            with self.subTest(bound_first=bound_first):
+                seen = []
+
+                class Worker:
+                    def run(self, cancel_event):
+                        seen.append(cancel_event)
+
+                w = Worker()
+                mine = threading.Event()
+                bound = [(w.run, ()), (w.run, (mine,))]
+                plain = [(Worker.run, (w,)), (Worker.run, (w, mine))]
+                manager = ThreadManager()
+                for target, args in (bound + plain if bound_first else plain + bound):
+                    manager.add_thread(target=target, args=args)
+                manager.start_all()
+                manager.join_all()
+
+                self.assertEqual(manager.exceptions(), {})
+                self.assertEqual(seen.count(mine), 2)
+                self.assertEqual(seen.count(manager.cancel_event), 2)
+
+    def test_add_many(self):
+        """Batch-registered threads run and report results and exceptions."""
+        def square(x):
+            return x * x
+
+        def fail():
+            raise ValueError("boom")
+
+        manager = ThreadManager()
+        items = manager.add_many([(square, (i,)) for i in range(3)] + [(fail, ())])
+        manager.start_all()
+
+        self.assertEqual(manager.join_all(), [])
+        self.assertEqual([it.name for it in items], ["square", "square-2", "square-3", "fail"])
+        self.assertEqual(manager.results(), {"square": 0, "square-2": 1, "square-3": 4, "fail": None})
+        self.assertIsInstance(manager.exceptions()["fail"], ValueError)
+
+    @unittest.skipUnless(importlib.util.find_spec("fastrlock"), "fastrlock not installed")
+    def test_uses_fastrlock_when_installed(self):
+        """The manager lock is fastrlock's FastRLock if the package is available."""
+        from fastrlock.rlock import FastRLock
+
+        self.assertIsInstance(ThreadManager()._lock, FastRLock)
+
+    def test_add_many_rejects_batch_with_bad_job(self):
+        """A non-callable job fails the whole batch without registering any of it."""
+        manager = ThreadManager()
+        manager.add_thread(target=lambda: None, name="first")
+        self.assertEqual(manager.results(), {"first": None})
+
+        with self.assertRaises(TypeError):
+            manager.add_many([(lambda: None, ()), (42, ())])
+
+        self.assertEqual(manager.all_names(), ["first"])
+        self.assertEqual(manager.results(), {"first": None})
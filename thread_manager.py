@@ -1,21 +1,48 @@
+import functools
+import inspect
 import logging
+import sys
 import threading
-import time
-from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional, Tuple
+import weakref
+from collections import deque
+from time import monotonic as _now
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+try:
+    from fastrlock.rlock import FastRLock as _RLock
+except ImportError:  # optional speedup; drop-in for threading.RLock
+    from threading import RLock as _RLock
 
 
-@dataclass
 class ManagedThread:
-    """Metadata and state for a managed thread."""
-    name: str
-    thread: threading.Thread
-    started: bool = False
-    start_time: Optional[float] = None
-    end_time: Optional[float] = None
-    result: Any = None
-    exception: Optional[Exception] = None
-    done: threading.Event = field(default_factory=threading.Event, repr=False)
+    """
+    Metadata and state for a managed thread.
+    start_time/end_time come from time.monotonic(); use them for durations.
+    """
+
+    __slots__ = (
+        "name", "thread", "started", "start_time", "end_time",
+        "result", "exception", "done",
+    )
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.thread: threading.Thread  # set by ThreadManager.add_thread
+        self.started = False
+        self.start_time: Optional[float] = None
+        self.end_time: Optional[float] = None
+        self.result: Any = None
+        self.exception: Optional[Exception] = None
+        self.done = threading.Event()
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(name={self.name!r}, thread={self.thread!r}, "
+            f"started={self.started!r}, start_time={self.start_time!r}, "
+            f"end_time={self.end_time!r}, result={self.result!r}, "
+            f"exception={self.exception!r})"
+        )
 
     @property
     def alive(self) -> bool:
@@ -25,10 +52,170 @@ class ManagedThread:
     def duration(self) -> Optional[float]:
         if self.start_time is None:
             return None
-        end = self.end_time if self.end_time is not None else time.time()
+        end = self.end_time if self.end_time is not None else _now()
         return end - self.start_time
 
 
+def _claim_name(items: Dict[str, Any], counts: Dict[str, int], base: str, item: Any) -> str:
+    """
+    Register `item` in `items` under `base` or the first free `base-N` and
+    return that name. `counts` remembers the last suffix handed out per base.
+    dict.setdefault claims a name atomically, so no lock is needed.
+    """
+    if items.setdefault(base, item) is item:
+        return base
+    # Resume suffixes where the last add with this base stopped
+    i = counts.get(base, 1) + 1
+    candidate = f"{base}-{i}"
+    while items.setdefault(candidate, item) is not item:
+        i += 1
+        candidate = f"{base}-{i}"
+    counts[base] = i
+    return candidate
+
+
+_ANY_POSITION = sys.maxsize
+
+# target (or a bound method's function) -> result of _inspect_cancel_position
+_cancel_positions: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def _inspect_cancel_position(target: Callable[..., Any]) -> Optional[int]:
+    if isinstance(target, functools.partial) and "cancel_event" in target.keywords:
+        return None  # the caller already bound one
+    try:
+        params = inspect.signature(target).parameters.values()
+    except (TypeError, ValueError):
+        return None
+    for index, param in enumerate(params):
+        if param.name == "cancel_event":
+            if param.kind is inspect.Parameter.KEYWORD_ONLY:
+                return _ANY_POSITION
+            if param.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD:
+                return index
+            return None
+    return None
+
+
+def _cancel_event_position(target: Callable[..., Any]) -> Optional[int]:
+    """
+    None if `target` has no `cancel_event` parameter that can be passed by
+    keyword; otherwise how many positional arguments fit before it
+    (_ANY_POSITION for keyword-only). Cached per target.
+    """
+    # Bound methods are new objects on every attribute access, so cache the
+    # plain function and account for the bound self/cls here
+    bound = inspect.ismethod(target)
+    key = target.__func__ if bound else target
+    try:
+        position = _cancel_positions[key]
+    except KeyError:
+        position = _cancel_positions[key] = _inspect_cancel_position(key)
+    except TypeError:  # not weak-referenceable or not hashable
+        position = _inspect_cancel_position(key)
+    if bound and position is not None and position != _ANY_POSITION:
+        position = position - 1 if position else None
+    return position
+
+
+class _RunState:
+    """
+    State shared between a ThreadManager and its runner threads: the queue of
+    finished names, memoized results()/exceptions() views, and a count of
+    running threads with an Event that is set whenever it drops to zero.
+    """
+
+    __slots__ = ("lock", "finished", "generation", "results", "exceptions", "running", "all_done")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.finished: deque = deque()  # names of finished threads, for remove_completed
+        self.generation = 0
+        self.results: Optional[Mapping[str, Any]] = None
+        self.exceptions: Optional[Mapping[str, Exception]] = None
+        self.running = 0
+        self.all_done = threading.Event()
+        self.all_done.set()
+
+    def invalidate(self) -> None:
+        """Drop the cached views."""
+        with self.lock:
+            self.generation += 1
+            self.results = self.exceptions = None
+
+    def add_running(self, count: int) -> None:
+        """Count threads that are about to start (negative to give claims back)."""
+        with self.lock:
+            self.running += count
+            if self.running:
+                self.all_done.clear()
+            else:
+                self.all_done.set()
+
+    def finish(self, name: str) -> None:
+        """Called by the runner when a thread is done."""
+        self.finished.append(name)
+        with self.lock:
+            self.generation += 1
+            self.results = self.exceptions = None
+            self.running -= 1
+            if not self.running:
+                self.all_done.set()
+
+
+def _run_safe(
+    item: ManagedThread,
+    target: Callable[..., Any],
+    args: Tuple[Any, ...],
+    kwargs: Dict[str, Any],
+    log: logging.Logger,
+    state: _RunState,
+) -> None:
+    """
+    Thread body for safe=True: exceptions are captured on `item` and logged.
+    Works on locals and writes the outcome back to `item` once.
+    """
+    item.start_time = _now()
+    result = error = None
+    try:
+        result = target(*args, **kwargs)
+    except Exception as exc:
+        error = exc
+        log.exception("Thread %s raised: %s", item.name, exc)
+    finally:
+        _finish(item, result, error, state)
+
+
+def _run_unsafe(
+    item: ManagedThread,
+    target: Callable[..., Any],
+    args: Tuple[Any, ...],
+    kwargs: Dict[str, Any],
+    state: _RunState,
+) -> None:
+    """Thread body for safe=False: exceptions propagate to threading's excepthook."""
+    item.start_time = _now()
+    result = None
+    try:
+        result = target(*args, **kwargs)
+    finally:
+        _finish(item, result, None, state)
+
+
+def _finish(
+    item: ManagedThread,
+    result: Any,
+    error: Optional[Exception],
+    state: _RunState,
+) -> None:
+    """Record the outcome and report the thread as finished."""
+    item.result = result
+    item.exception = error
+    item.end_time = _now()
+    state.finish(item.name)
+    item.done.set()
+
+
 class ThreadManager:
     """
     Manage multiple threads with:
@@ -44,7 +231,9 @@ class ThreadManager:
         self._log = logging.getLogger(self.__class__.__name__)
         self._default_daemon = default_daemon
         self._items: Dict[str, ManagedThread] = {}
-        self._lock = threading.RLock()
+        self._name_counts: Dict[str, int] = {}  # base name -> last suffix handed out
+        self._state = _RunState()
+        self._lock = _RLock()
         self.cancel_event = threading.Event()
 
     # ---------- Public API ----------
@@ -58,59 +247,79 @@ class ThreadManager:
         name: Optional[str] = None,
         daemon: Optional[bool] = None,
         safe: bool = True,
+        pass_cancel: Optional[bool] = None,
     ) -> ManagedThread:
         """
         Register a new (not yet started) thread.
         - safe=True: capture exceptions, store in ManagedThread.exception, and log.
         - kwargs supported; name auto-uniqued if omitted or duplicate.
+        - targets with a `cancel_event` parameter get the manager's cancel_event
+          passed in, unless args/kwargs already supply one (pass_cancel=True/False
+          overrides the detection).
         """
         if not callable(target):
             raise TypeError("target must be callable")
 
-        kwargs = kwargs or {}
+        kwargs = self._with_cancel(target, args, kwargs or {}, pass_cancel)
         base_name = name or getattr(target, "__name__", "worker")
-        unique_name = self._unique_name(base_name)
         daemon = self._default_daemon if daemon is None else daemon
 
-        def _runner() -> None:
-            item = self._items[unique_name]
-            item.started = True
-            item.start_time = time.time()
-            try:
-                if safe:
-                    try:
-                        item.result = target(*args, **kwargs)
-                    except Exception as exc:
-                        item.exception = exc
-                        self._log.exception("Thread %s raised: %s", unique_name, exc)
-                else:
-                    item.result = target(*args, **kwargs)
-            finally:
-                item.end_time = time.time()
-                item.done.set()
-
-        th = threading.Thread(target=_runner, name=unique_name, daemon=daemon)
-        item = ManagedThread(name=unique_name, thread=th)
-        with self._lock:
-            self._items[unique_name] = item
+        item = self._new_item(
+            base_name, _run_safe if safe else _run_unsafe, target, args, kwargs, daemon
+        )
+        self._state.invalidate()
         return item
 
+    def add_many(
+        self,
+        jobs: Iterable[Sequence[Any]],
+        *,
+        name: Optional[str] = None,
+        daemon: Optional[bool] = None,
+        safe: bool = True,
+        pass_cancel: Optional[bool] = None,
+    ) -> List[ManagedThread]:
+        """
+        Register many threads in one call; each job is (target, args) or
+        (target, args, kwargs). The options apply to every job and mean the
+        same as in add_thread. Cheaper than looping over add_thread: options
+        are resolved once and the cached views are dropped once.
+        """
+        daemon = self._default_daemon if daemon is None else daemon
+        runner = _run_safe if safe else _run_unsafe
+        # Check every job before registering any, so a bad one leaves no partial batch
+        specs = []
+        for job in jobs:
+            target, args = job[0], job[1]
+            if not callable(target):
+                raise TypeError("target must be callable")
+            specs.append((target, args, (job[2] if len(job) > 2 else None) or {}))
+        items: List[ManagedThread] = []
+        for target, args, kwargs in specs:
+            kwargs = self._with_cancel(target, args, kwargs, pass_cancel)
+            base_name = name or getattr(target, "__name__", "worker")
+            items.append(self._new_item(base_name, runner, target, args, kwargs, daemon))
+        if items:
+            self._state.invalidate()
+        return items
+
     def start_all(self) -> List[str]:
         """
         Start all not-yet-started threads (skips if cancel_event is set).
         Returns list of started thread names.
         """
-        started: List[str] = []
+        # Claim under the lock so a concurrent start() can't double-start;
+        # thread.start() itself runs with the lock released.
         with self._lock:
             if self.cancel_event.is_set():
                 self._log.warning("Cancel flag set; start_all skipped.")
-                return started
-            for item in self._items.values():
-                if not item.started and not item.thread.is_alive():
-                    self._log.debug("Starting thread: %s", item.name)
-                    item.thread.start()
-                    started.append(item.name)
-        return started
+                return []
+            claimed = [it for it in list(self._items.values()) if not it.started]
+            for item in claimed:
+                item.started = True
+            self._state.add_running(len(claimed))
+        self._start_claimed(claimed)
+        return [item.name for item in claimed]
 
     def start(self, name: str) -> bool:
         """
@@ -122,35 +331,41 @@ class ThreadManager:
                 self._log.warning("Cancel flag set; start('%s') skipped.", name)
                 return False
             item = self._require(name)
-            if item.started or item.thread.is_alive():
+            if item.started:
                 self._log.debug("Thread %s already started; skipping.", name)
                 return False
-            self._log.debug("Starting thread: %s", name)
-            item.thread.start()
-            return True
+            item.started = True
+            self._state.add_running(1)
+        self._start_claimed([item])
+        return True
 
     def join_all(self, timeout: Optional[float] = None) -> List[str]:
         """
-        Join all threads. `timeout` is an overall budget (not per-thread).
-        Returns list of thread names still alive after the join attempt.
+        Wait for all started threads. `timeout` is an overall budget (not per-thread).
+        Returns list of thread names still running after the wait.
+        The manager lock is not held while waiting.
         """
-        deadline = None if timeout is None else (time.time() + timeout)
+        deadline = None if timeout is None else (_now() + timeout)
         with self._lock:
-            for item in self._items.values():
-                remaining = None
-                if deadline is not None:
-                    remaining = max(0.0, deadline - time.time())
-                    if remaining == 0.0:
-                        break
-                self._log.debug("Joining thread: %s", item.name)
-                item.thread.join(timeout=remaining)
-            return [n for n, it in self._items.items() if it.alive]
+            items = list(self._items.values())
+        still_running: List[str] = []
+        for item in items:
+            # Unstarted or already finished: nothing to wait for
+            if not item.started or item.done.is_set():
+                continue
+            # Once the budget is spent, wait(0.0) just reports the current state
+            remaining = None if deadline is None else max(0.0, deadline - _now())
+            self._log.debug("Joining thread: %s", item.name)
+            if not item.done.wait(timeout=remaining):
+                still_running.append(item.name)
+        return still_running
 
     def join(self, name: str, timeout: Optional[float] = None) -> bool:
-        """Join one thread. Returns True if finished, False if still alive."""
+        """Wait for one thread. Returns True if finished, False if still running."""
         item = self._require(name)
-        item.thread.join(timeout=timeout)
-        return not item.thread.is_alive()
+        if not item.started:
+            raise RuntimeError(f"Thread '{name}' has not been started")
+        return item.done.wait(timeout=timeout)
 
     def get_result(self, name: str, *, rethrow: bool = True) -> Any:
         """
@@ -162,41 +377,48 @@ class ThreadManager:
             raise item.exception
         return item.result
 
-    def results(self) -> Dict[str, Any]:
-        """Return dict: name -> result (None if not set or errored)."""
-        with self._lock:
-            return {n: it.result for n, it in self._items.items()}
+    def results(self) -> Mapping[str, Any]:
+        """
+        Return read-only mapping: name -> result (None if not set or errored).
+        The mapping is cached until a thread finishes or threads are added/removed.
+        """
+        return self._cached_view(
+            "results", lambda items: {n: it.result for n, it in items}
+        )
 
-    def exceptions(self) -> Dict[str, Exception]:
-        """Return dict: name -> exception for threads that raised."""
-        with self._lock:
-            return {n: it.exception for n, it in self._items.items() if it.exception is not None}
+    def exceptions(self) -> Mapping[str, Exception]:
+        """Return read-only mapping: name -> exception for threads that raised (cached like results)."""
+        return self._cached_view(
+            "exceptions",
+            lambda items: {n: it.exception for n, it in items if it.exception is not None},
+        )
 
     def remove_completed(self) -> List[str]:
         """Remove finished threads from the manager; returns removed names."""
         removed: List[str] = []
-        with self._lock:
-            for name in list(self._items.keys()):
-                it = self._items[name]
-                if it.started and not it.alive:
-                    removed.append(name)
-                    del self._items[name]
+        # deque.popleft and dict.pop are atomic, so no lock is needed
+        while True:
+            try:
+                name = self._state.finished.popleft()
+            except IndexError:
+                break
+            if self._items.pop(name, None) is not None:
+                removed.append(name)
+        if removed:
+            self._state.invalidate()
         return removed
 
     def active_names(self) -> List[str]:
         """Names of currently alive threads."""
-        with self._lock:
-            return [n for n, it in self._items.items() if it.alive]
+        return [n for n, it in list(self._items.items()) if it.alive]
 
     def all_names(self) -> List[str]:
         """All registered thread names."""
-        with self._lock:
-            return list(self._items.keys())
+        return list(self._items)
 
     def is_all_done(self) -> bool:
         """True if no threads are alive."""
-        with self._lock:
-            return not any(it.alive for it in self._items.values())
+        return not any(it.alive for it in list(self._items.values()))
 
     def cancel(self) -> None:
         """Set the cooperative cancel flag (workers should check it)."""
@@ -208,26 +430,98 @@ class ThreadManager:
 
     def __exit__(self, exc_type, exc, tb) -> bool:
         self.cancel_event.set()
-        leftover = self.join_all(timeout=5.0)
-        if leftover:
-            self._log.warning("Threads still alive on exit: %s", leftover)
+        # One wait on the aggregate Event instead of one per thread
+        if not self._state.all_done.wait(timeout=5.0):
+            self._log.warning("Threads still alive on exit: %s", self.join_all(timeout=0))
+        # done is set just before a thread exits; reap the finished ones
+        for item in list(self._items.values()):
+            if item.done.is_set():
+                item.thread.join()
         # do not suppress exceptions from with-body
         return False
 
     # ---------- Internal helpers ----------
 
+    def _cached_view(self, attr: str, build: Callable[[list], dict]) -> Mapping[str, Any]:
+        state = self._state
+        with state.lock:
+            view = getattr(state, attr)
+            generation = state.generation
+        if view is None:
+            view = MappingProxyType(build(list(self._items.items())))
+            with state.lock:
+                # Don't cache a snapshot that a finishing thread already made stale
+                if state.generation == generation:
+                    setattr(state, attr, view)
+        return view
+
+    def _start_claimed(self, claimed: List[ManagedThread]) -> None:
+        """Start threads claimed by start()/start_all(), with the lock released."""
+        for index, item in enumerate(claimed):
+            self._log.debug("Starting thread: %s", item.name)
+            try:
+                item.thread.start()
+            except BaseException:
+                # Hand back this claim and the ones not tried yet, so they
+                # can be started again and nobody waits on them meanwhile
+                unstarted = claimed[index:]
+                with self._lock:
+                    for it in unstarted:
+                        it.started = False
+                    self._state.add_running(-len(unstarted))
+                raise
+
+    def _with_cancel(
+        self,
+        target: Callable[..., Any],
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        pass_cancel: Optional[bool],
+    ) -> Dict[str, Any]:
+        """Add cancel_event to `kwargs` if the target takes it and the caller didn't pass one."""
+        if pass_cancel is None:
+            position = _cancel_event_position(target)
+        else:
+            position = _ANY_POSITION if pass_cancel else None
+        if position is None or len(args) > position or "cancel_event" in kwargs:
+            return kwargs
+        return dict(kwargs, cancel_event=self.cancel_event)
+
+    def _new_item(
+        self,
+        base_name: str,
+        runner: Callable[..., None],
+        target: Callable[..., Any],
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+        daemon: bool,
+    ) -> ManagedThread:
+        item = ManagedThread(name=base_name)
+        if runner is _run_safe:
+            run_args = (item, target, args, kwargs, self._log, self._state)
+        else:  # _run_unsafe doesn't log
+            run_args = (item, target, args, kwargs, self._state)
+        item.thread = threading.Thread(
+            target=runner,
+            args=run_args,
+            name=base_name,
+            daemon=daemon,
+        )
+        self._unique_name(base_name, item)
+        return item
+
     def _require(self, name: str) -> ManagedThread:
-        with self._lock:
-            item = self._items.get(name)
-            if item is None:
-                raise KeyError(f"No thread named '{name}'")
-            return item
+        item = self._items.get(name)
+        if item is None:
+            raise KeyError(f"No thread named '{name}'")
+        return item
 
-    def _unique_name(self, base: str) -> str:
-        with self._lock:
-            if base not in self._items:
-                return base
-            i = 2
-            while f"{base}-{i}" in self._items:
-                i += 1
-            return f"{base}-{i}"
+    def _unique_name(self, base: str, item: ManagedThread) -> str:
+        """
+        Register `item` under `base` or the first free `base-N`, and rename it
+        (and its thread) to match.
+        """
+        candidate = _claim_name(self._items, self._name_counts, base, item)
+        item.name = candidate
+        item.thread.name = candidate
+        return candidate